@@ -3,12 +3,15 @@
 import argparse
 import datetime as dt
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import tqdm
 
 from parliai_public import dates
 from parliai_public.readers import Debates, WrittenAnswers
 
+PBAR_WIDTH = 80
+
 
 def create_reader(
     reader_class: type[Debates] | type[WrittenAnswers],
@@ -51,6 +54,7 @@ def make_summary(
     reader: Debates | WrittenAnswers,
     header: str,
     save: bool = True,
+    threads: int = 8,
 ) -> str:
     """
     Collect and summarise the latest entries in Parliament.
@@ -71,6 +75,9 @@ def make_summary(
         Section header for the reader.
     save : bool, default=True
         Whether to save the collected and analysed transcripts.
+    threads : int, default=8
+        Number of threads used to fetch and read entries concurrently.
+        Analysis by the LLM still happens one entry at a time.
 
     Returns
     -------
@@ -83,16 +90,20 @@ def make_summary(
     content = ""
 
     if entries:
-        width = max(map(len, entries))
-        for entry in (pbar := tqdm.tqdm(entries)):
-            pbar.set_description(f"Processing {entry.ljust(width)}")
-            page = reader.read(entry)
-            if page:
-                analysed = reader.analyse(page)
-                rendering = reader.render(analysed)
-                sections.append(rendering)
-                if save:
-                    reader.save(analysed)
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            pages = executor.map(reader.read, entries)
+            for entry, page in (
+                pbar := tqdm.tqdm(zip(entries, pages), total=len(entries))
+            ):
+                pbar.set_description(
+                    f"Processing {entry[:PBAR_WIDTH].ljust(PBAR_WIDTH)}"
+                )
+                if page:
+                    analysed = reader.analyse(page)
+                    rendering = reader.render(analysed)
+                    sections.append(rendering)
+                    if save:
+                        reader.save(analysed)
 
         content = "\n\n".join(sections)
 
@@ -161,6 +172,13 @@ def main():
         action="store_true",
         help="do not save data from collected pages",
     )
+    parser.add_argument(
+        "-t",
+        "--threads",
+        type=int,
+        default=8,
+        help="number of threads for fetching pages (default 8)",
+    )
     args = vars(parser.parse_args())
 
     start = args.get("start")
@@ -168,6 +186,7 @@ def main():
     window = args.get("window")
     form = args["form"]
     save = not args["no_save"]
+    threads = args["threads"]
 
     if args.get("weekly"):
         start, end, window = None, None, 8
@@ -187,9 +206,8 @@ def main():
         date_list=date_list,
     )
 
-    # TODO: refactor to single LLM instantiation
     debates.instantiate_llm()
-    written.instantiate_llm()
+    written.llm_name, written.llm = debates.llm_name, debates.llm
 
     debates.make_outdir()
     written.outdir = debates.outdir
@@ -197,13 +215,20 @@ def main():
     summary = "\n\n".join(
         (
             debates.make_header(urls=debates.urls + written.urls),
-            make_summary(debates, "# Debates", save),
+            make_summary(debates, "# Debates", save, threads),
             make_summary(
-                written, "# Written answers (UK Parliament only)", save
+                written,
+                "# Written answers (UK Parliament only)",
+                save,
+                threads,
             ),
         )
     )
 
+    hits = debates.cache_hits + written.cache_hits
+    misses = debates.cache_misses + written.cache_misses
+    print(f"LLM cache: {hits} hits, {misses} misses")
+
     print("Saving summary...")
     with open(os.path.join(debates.outdir, "summary.md"), "w") as f:
         f.write(summary)
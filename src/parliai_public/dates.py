@@ -45,10 +45,13 @@ def list_dates(
     _check_date_parameters(start, end, window)
 
     window = window or 1
-    if isinstance(start, dt.date):
-        window = (end - start).days + 1
+    if not isinstance(start, dt.date):
+        start = end - dt.timedelta(days=window - 1)
+
+    day = dt.timedelta(days=1)
+    length = (end - start).days + 1
 
-    return [end - dt.timedelta(days=x) for x in range(window)][::-1]
+    return [start + day * x for x in range(length)]
 
 
 def _format_date(
@@ -1,24 +1,182 @@
 """Base class for other readers to inherit from."""
 
 import abc
+import copy
 import datetime as dt
-import json
+import functools
+import glob
+import hashlib
 import os
 import re
+import sys
+import threading
+import warnings
 from importlib import resources
-from typing import Iterable
-from urllib.parse import urlparse
+from typing import Iterable, Iterator
+from urllib.parse import urlsplit
 
+import lxml.html
+import orjson
 import requests
-import toml
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from langchain.docstore.document import Document
 from langchain.prompts import PromptTemplate
-from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain_community.chat_models import ChatOllama
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from parliai_public import dates
 
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+_LAST_SPACE_RE = re.compile(r".*\s", re.DOTALL)
+_SPACE_RE = re.compile(r"\s")
+
+
+@functools.lru_cache(maxsize=None)
+def _load_packaged_config(name: str) -> dict:
+    """
+    Load a configuration file shipped with the package.
+
+    Each file is only read and parsed once; later calls return the same
+    dictionary, so it should not be modified.
+
+    Parameters
+    ----------
+    name : str
+        Name of the configuration file, e.g. `base.toml`.
+
+    Returns
+    -------
+    config : dict
+        Dictionary containing the configuration details.
+    """
+
+    where = resources.files("parliai_public._config")
+
+    return tomllib.loads(where.joinpath(name).read_text(encoding="utf-8"))
+
+
+def _load_base_config() -> dict:
+    """
+    Load the base configuration file shipped with the package.
+
+    Returns
+    -------
+    config : dict
+        Dictionary containing the base configuration details. This is
+        shared between calls, so it should not be modified.
+    """
+
+    return _load_packaged_config("base.toml")
+
+
+def _normalise(text: str) -> str:
+    """
+    Lower-case a string and strip out its punctuation.
+
+    Parameters
+    ----------
+    text : str
+        String to be normalised.
+
+    Returns
+    -------
+    normalised : str
+        Lower-case string with only word characters and whitespace.
+    """
+
+    return _PUNCTUATION_RE.sub("", text.lower())
+
+
+def _write_atomically(path: str, data: bytes) -> None:
+    """
+    Write some bytes to a file without leaving a partial file behind.
+
+    The data are written to a temporary file first and then moved into
+    place, so an interrupted run (or another thread) never sees a
+    half-written file.
+
+    Parameters
+    ----------
+    path : str
+        Location of the file to write.
+    data : bytes
+        Contents of the file.
+    """
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    temp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temp, "wb") as f:
+        f.write(data)
+
+    os.replace(temp, path)
+
+
+def _chunk_bounds(
+    text: str, sep: str, size: int, overlap: int
+) -> Iterator[tuple[int, int]]:
+    """
+    Find the start and end of each chunk window over some text.
+
+    A window ends at the last separator inside it or, failing that, at
+    the last whitespace, so words are only cut when a window has no
+    whitespace at all. When the next window cannot start after a
+    separator, it backs up by `overlap` characters (to the next word,
+    where there is one) so that terms spanning the cut are kept whole
+    in at least one window.
+
+    Parameters
+    ----------
+    text : str
+        Text to be split.
+    sep : str
+        Separator to define natural chunks.
+    size : int
+        Maximum window size in characters. Must be positive.
+    overlap : int
+        Overlap between windows in characters.
+
+    Yields
+    ------
+    bounds : tuple[int, int]
+        Start and end indices of the next window.
+    """
+
+    start, length = 0, len(text)
+    while start < length:
+        end = min(start + size, length)
+        if end < length:
+            cut = text.rfind(sep, start, end)
+            if cut <= start and (
+                space := _LAST_SPACE_RE.match(text, start, end)
+            ):
+                cut = space.end() - 1
+            if cut > start:
+                end = cut
+
+        yield start, end
+
+        if end >= length:
+            break
+
+        back = max(end - max(overlap, 0), start + 1)
+        boundary = text.find(sep, back, end)
+        if boundary != -1:
+            start = boundary + len(sep)
+        elif text.startswith(sep, end):
+            start = end + len(sep)
+        elif back < end and (space := _SPACE_RE.search(text, back - 1, end)):
+            start = space.end()
+        else:
+            start = back
+
 
 class BaseReader(metaclass=abc.ABCMeta):
     """
@@ -49,7 +207,10 @@ class BaseReader(metaclass=abc.ABCMeta):
         List of dates from which to pull entries. The `parliai_public.dates`
         module may be of help. If not specified, only yesterday is used.
     outdir : str, default="out"
-        Location of a directory in which to write outputs.
+        Location of a directory in which to write outputs. LLM responses,
+        downloaded pages, and pages that have been read are also cached
+        in `.llm_cache`, `.http_cache`, and `.page_cache` directories
+        here, so they can be reused by later runs.
     prompt : str, optional
         System prompt provided to the LLM. If not specified, this is
         read from the default configuration file.
@@ -62,6 +223,10 @@ class BaseReader(metaclass=abc.ABCMeta):
 
     _default_config: str = "base.toml"
     _source: None | str = None
+    _llm_concurrency: int = 4
+    _http_concurrency: int = 8
+    _parser: str = "lxml"
+    _page_cache_version: int = 1
 
     def __init__(
         self,
@@ -75,25 +240,67 @@ class BaseReader(metaclass=abc.ABCMeta):
         inconsistency_statement: None | str = None,
     ) -> None:
         self.urls = urls
-        base_config = toml.load("src/parliai_public/_config/base.toml")
-        self.terms = terms or base_config["keywords"]
+        base_config = _load_base_config()
+        self.terms = terms or list(base_config["keywords"])
         self.inconsistency_statement = (
             inconsistency_statement or base_config["inconsistency_statement"]
         )
         self.dates = dates or [dt.date.today() - dt.timedelta(days=1)]
         self.outdir = outdir
+        self._llm_cache_dir = os.path.join(outdir, ".llm_cache")
+        self._http_cache_dir = os.path.join(outdir, ".http_cache")
+        self._page_cache_dir = os.path.join(outdir, ".page_cache")
+        self._cache_hits, self._cache_misses = 0, 0
 
         config = self._load_config()
         self.prompt = prompt or config["prompt"]
         self.llm_name = llm_name or config["llm_name"]
         self.llm = llm
 
+        self._session = self._make_session()
+
+    @staticmethod
+    def _make_session() -> requests.Session:
+        """
+        Create an HTTP session for retrieving web pages.
+
+        The session keeps connections alive between requests, so pages
+        from the same host can reuse a connection rather than opening a
+        new one each time. Failed requests caused by a flaky server are
+        retried a few times with a small backoff. If the server is still
+        failing after that, the last response is returned as it is
+        rather than raising, so one bad page cannot stop a whole run.
+
+        Returns
+        -------
+        session : requests.Session
+            Session with a pooled, retrying adapter mounted.
+        """
+
+        retries = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504],
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=16, pool_maxsize=16, max_retries=retries
+        )
+
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        return session
+
     @classmethod
     def _load_config(cls, path: None | str = None) -> dict:
         """
         Load a configuration file from disk.
 
-        If no path is supplied, the default is used for the class.
+        If no path is supplied, the default is used for the class. The
+        default file is only parsed once, and each call gets its own
+        copy of it.
 
         Parameters
         ----------
@@ -107,13 +314,10 @@ class BaseReader(metaclass=abc.ABCMeta):
         """
 
         if isinstance(path, str):
-            return toml.load(path)
-
-        where = resources.files("parliai_public._config")
-        with resources.as_file(where.joinpath(cls._default_config)) as c:
-            config = toml.load(c)
+            with open(path, "rb") as f:
+                return tomllib.load(f)
 
-        return config
+        return copy.deepcopy(_load_packaged_config(cls._default_config))
 
     @classmethod
     def from_toml(cls, path: None | str = None) -> "BaseReader":
@@ -182,19 +386,94 @@ class BaseReader(metaclass=abc.ABCMeta):
             Whether the string contains any search terms.
         """
 
-        terms = self.terms
-        if not terms:
+        if self._terms_re is None:
             return True
 
-        string = string.lower()
-        for term in map(str.lower, terms):
-            match = re.search(
-                rf"(^|(?<=[\('\[\s])){term}(?=[\)\]\s!?.,:;'-]|$)", string
-            )
-            if match:
-                return True
+        return self._terms_re.search(string) is not None
 
-        return False
+    @staticmethod
+    def _compile_terms(terms: Iterable[str]) -> None | re.Pattern:
+        """
+        Compile the search terms into a single regular expression.
+
+        Each term is escaped and joined into one alternation, so a
+        string is only scanned once however many terms there are.
+        Matching ignores case. The surrounding characters allowed for a
+        match are described in `check_contains_terms()`.
+
+        Parameters
+        ----------
+        terms : Iterable[str]
+            Search terms to compile.
+
+        Returns
+        -------
+        pattern : None | re.Pattern
+            Compiled pattern, or `None` if there are no terms.
+        """
+
+        terms = [re.escape(term) for term in terms]
+        if not terms:
+            return None
+
+        pattern = "|".join(terms)
+        pattern = rf"(?:^|(?<=[\('\[\s]))(?:{pattern})(?=[\)\]\s!?.,:;'-]|$)"
+
+        return re.compile(pattern, re.IGNORECASE)
+
+    @property
+    def terms(self) -> Iterable[str]:
+        """Key terms to filter content on."""
+
+        return self._terms
+
+    @terms.setter
+    def terms(self, terms: Iterable[str]) -> None:
+        """Set the terms and compile the patterns that search for them."""
+
+        self._terms = terms
+        self._terms_lower = tuple(dict.fromkeys(map(str.lower, terms)))
+        self._terms_re = self._compile_terms(self._terms_lower)
+
+    @property
+    def prompt(self) -> str:
+        """Template for the prompt sent to the LLM with each chunk."""
+
+        return self._prompt
+
+    @prompt.setter
+    def prompt(self, prompt: str) -> None:
+        """Set the prompt and build the template that fills it in."""
+
+        self._prompt = prompt
+        self._prompt_template = PromptTemplate(
+            input_variables=["keywords", "text"], template=prompt
+        )
+
+    @property
+    def dates(self) -> list[dt.date]:
+        """List of dates from which to pull entries."""
+
+        return self._dates
+
+    @dates.setter
+    def dates(self, dates: list[dt.date]) -> None:
+        """Set the dates and the period they cover."""
+
+        self._dates = dates
+        self._period = min(dates), max(dates)
+
+    @property
+    def cache_hits(self) -> int:
+        """Number of chunks answered from the LLM cache so far."""
+
+        return self._cache_hits
+
+    @property
+    def cache_misses(self) -> int:
+        """Number of chunks sent to the LLM so far."""
+
+        return self._cache_misses
 
     def make_outdir(self) -> None:
         """
@@ -206,8 +485,7 @@ class BaseReader(metaclass=abc.ABCMeta):
             Updated output directory, defined by the runtime parameters.
         """
 
-        start, end = min(self.dates), max(self.dates)
-        period = ".".join(map(dt.date.isoformat, [start, end]))
+        period = ".".join(map(dt.date.isoformat, self._period))
         name = ".".join((period, self.llm_name))
 
         outdir = os.path.join(self.outdir, name)
@@ -221,7 +499,8 @@ class BaseReader(metaclass=abc.ABCMeta):
         Determine a unique version for the output directory and tag it.
 
         If the output directory already exists, then we add a number tag
-        to the end of the directory name. This number is incremental.
+        to the end of the directory name. This number is one more than
+        the largest existing tag.
 
         Parameters
         ----------
@@ -237,11 +516,13 @@ class BaseReader(metaclass=abc.ABCMeta):
         if not os.path.exists(outdir):
             return outdir
 
-        tag = 1
-        while os.path.exists(updated := ".".join((outdir, str(tag)))):
-            tag += 1
+        tags = (
+            path.rsplit(".", 1)[-1]
+            for path in glob.glob(f"{glob.escape(outdir)}.*")
+        )
+        tag = max((int(tag) for tag in tags if tag.isdigit()), default=0)
 
-        return updated
+        return f"{outdir}.{tag + 1}"
 
     @abc.abstractmethod
     def retrieve_latest_entries(self) -> list[str]:
@@ -255,7 +536,12 @@ class BaseReader(metaclass=abc.ABCMeta):
             information.
         """
 
-    def get(self, url: str, check: bool = True) -> None | BeautifulSoup:
+    def get(
+        self,
+        url: str,
+        check: bool = True,
+        parse_only: None | SoupStrainer = None,
+    ) -> None | BeautifulSoup:
         """
         Retrieve the HTML soup for a web page.
 
@@ -265,26 +551,157 @@ class BaseReader(metaclass=abc.ABCMeta):
             Link to the web page.
         check : bool, default=True
             Whether to check the page for any relevant terms. Default is
-            to do so.
+            to do so. Irrelevant pages are discarded before any soup is
+            made from them.
+        parse_only : None | bs4.SoupStrainer, optional
+            Strainer limiting which tags make it into the soup. If not
+            specified, the whole page is parsed.
 
         Returns
         -------
         soup : None | bs4.BeautifulSoup
             HTML soup of the web page if the page contains any relevant
             terms. Otherwise, `None`.
+
+        Raises
+        ------
+        requests.HTTPError
+            If the web page could not be retrieved.
         """
 
-        page = requests.get(url)
-        soup = BeautifulSoup(page.content, "html.parser")
-        if (not check) or (
-            check and self.check_contains_terms(soup.get_text())
+        content = self._fetch(url)
+        if check and not self.check_contains_terms(
+            self._extract_text(content)
         ):
-            return soup
+            return None
+
+        return self._parse(content, parse_only)
+
+    def _parse(
+        self, content: bytes | str, parse_only: None | SoupStrainer = None
+    ) -> BeautifulSoup:
+        """
+        Build the HTML soup for the content of a web page.
+
+        All soups used by a reader are made here, so the choice of tree
+        builder lives in one place.
+
+        Parameters
+        ----------
+        content : bytes | str
+            Raw content of the web page.
+        parse_only : None | bs4.SoupStrainer, optional
+            Strainer limiting which tags make it into the soup.
+
+        Returns
+        -------
+        soup : bs4.BeautifulSoup
+            HTML soup of the web page.
+        """
+
+        return BeautifulSoup(content, self._parser, parse_only=parse_only)
+
+    def _fetch(self, url: str) -> bytes:
+        """
+        Download the content of a web page, reusing a cached copy.
+
+        If the server gave an `ETag` or `Last-Modified` header when we
+        last downloaded the page, we keep a copy of it on disk. Next
+        time, we send a conditional request and, if the server says the
+        page has not changed, we use our copy instead of downloading the
+        page again.
+
+        Parameters
+        ----------
+        url : str
+            Link to the web page.
+
+        Returns
+        -------
+        content : bytes
+            Raw content of the web page.
+
+        Raises
+        ------
+        requests.HTTPError
+            If the server does not return the page, even after retries.
+        """
+
+        key = hashlib.sha256(url.encode()).hexdigest()
+        body = os.path.join(self._http_cache_dir, f"{key}.html")
+        meta = os.path.join(self._http_cache_dir, f"{key}.json")
+
+        validators = {}
+        if os.path.exists(meta) and os.path.exists(body):
+            with open(meta, "rb") as f:
+                validators = orjson.loads(f.read())
+
+        headers = {}
+        if "etag" in validators:
+            headers["If-None-Match"] = validators["etag"]
+        if "modified" in validators:
+            headers["If-Modified-Since"] = validators["modified"]
+
+        page = self._session.get(url, headers=headers, timeout=30)
+        if page.status_code == 304 and validators:
+            with open(body, "rb") as f:
+                return f.read()
+
+        if page.status_code != 200:
+            raise requests.HTTPError(
+                f"{page.status_code} response for {url}", response=page
+            )
+
+        etag, modified = (
+            page.headers.get(name) for name in ("ETag", "Last-Modified")
+        )
+        if page.status_code == 200 and (etag or modified):
+            validators = {"etag": etag, "modified": modified}
+            validators = {k: v for k, v in validators.items() if v}
+            _write_atomically(body, page.content)
+            _write_atomically(meta, orjson.dumps(validators))
+
+        return page.content
+
+    @staticmethod
+    def _extract_text(content: bytes | str) -> str:
+        """
+        Extract the text from a web page without building any soup.
+
+        We parse the page with lxml directly, which is much faster than
+        going through BeautifulSoup when all we need is the text. The
+        contents of script, style and template tags are removed first,
+        so the text matches what `bs4.BeautifulSoup.get_text()` gives.
+
+        Parameters
+        ----------
+        content : bytes | str
+            HTML content of the web page.
+
+        Returns
+        -------
+        text : str
+            Plain text of the web page. Empty if there is no document.
+        """
+
+        try:
+            tree = lxml.html.document_fromstring(content)
+        except etree.ParserError:
+            return ""
+
+        etree.strip_elements(
+            tree, "script", "style", "template", with_tail=False
+        )
+
+        return tree.text_content()
 
     def read(self, url: str) -> None | dict:
         """
         Read a web page, and return its contents if it is relevant.
 
+        Pages that could not be retrieved are skipped with a warning.
+        They are never cached, so a later run tries them again.
+
         Parameters
         ----------
         url : str
@@ -297,15 +714,63 @@ class BaseReader(metaclass=abc.ABCMeta):
             the page text and metadata. Otherwise, `None`.
         """
 
-        soup = self.get(url)
+        # bump the version whenever parsing changes, so stale pages from
+        # earlier runs are read again rather than reused
+        request = "|".join(
+            (
+                str(self._page_cache_version),
+                type(self).__name__,
+                url,
+                str(self._terms_lower),
+            )
+        )
+        key = hashlib.sha256(request.encode()).hexdigest()
+        path = os.path.join(self._page_cache_dir, f"{key}.json")
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                return orjson.loads(f.read())["page"]
+
+        try:
+            soup = self.get(url)
+        except requests.HTTPError as error:
+            warnings.warn(f"Could not read {url}: {error}", UserWarning)
+            return None
+
         page = None
         if soup is not None:
             metadata = self._read_metadata(url, soup)
             contents = self._read_contents(soup)
             page = {**metadata, **contents}
+            # the tree is full of reference cycles, so free it now rather
+            # than waiting on the garbage collector
+            soup.decompose()
+
+        if self._is_settled(url):
+            _write_atomically(path, orjson.dumps({"page": page}))
 
         return page
 
+    def _is_settled(self, url: str) -> bool:
+        """
+        Determine whether the content of a web page will not change.
+
+        Pages that will not change are cached once they have been read,
+        along with whether they were relevant. By default, we cannot
+        tell, so nothing is cached.
+
+        Parameters
+        ----------
+        url : str
+            Link to the web page.
+
+        Returns
+        -------
+        settled : bool
+            Whether the page can be cached.
+        """
+
+        return False
+
     @abc.abstractmethod
     def _read_metadata(self, url: str, soup: BeautifulSoup) -> dict:
         """
@@ -365,23 +830,55 @@ class BaseReader(metaclass=abc.ABCMeta):
             Updated transcript with the LLM response.
         """
 
-        chunks = self._split_text_into_chunks(transcript["text"])
+        (transcript,) = self.analyse_many([transcript])
 
-        responses = []
-        for chunk in chunks:
-            if self.check_contains_terms(chunk.page_content):
-                response = self._analyse_chunk(chunk)
+        return transcript
 
+    def analyse_many(self, transcripts: list[dict]) -> list[dict]:
+        """
+        Analyse several pieces of text with one batch of LLM requests.
+
+        The relevant chunks of every transcript are sent to the LLM
+        together, and the responses are handed back to the transcript
+        they came from.
+
+        Parameters
+        ----------
+        transcripts : list[dict]
+            Transcripts, each with a `text` entry to be analysed.
+
+        Returns
+        -------
+        transcripts : list[dict]
+            Updated transcripts with their LLM responses.
+        """
+
+        chunked = [
+            [
+                chunk
+                for chunk in self._split_text_into_chunks(transcript["text"])
+                if self.check_contains_terms(chunk.page_content)
+            ]
+            for transcript in transcripts
+        ]
+
+        responses = iter(
+            self._analyse_chunks(
+                [chunk for chunks in chunked for chunk in chunks]
+            )
+        )
+        for transcript, chunks in zip(transcripts, chunked):
+            checked = []
+            for chunk, response in zip(chunks, responses):
                 # failed check
                 if not self._check_response(response, chunk):
                     response += f"\n\n{self.inconsistency_statement}"
                     print("LLM response inconsistent with source.")
+                checked.append(response)
 
-                responses.append(response)
+            transcript["response"] = "\n\n".join(checked)
 
-        transcript["response"] = "\n\n".join(responses)
-
-        return transcript
+        return transcripts
 
     def clean_response(self, response: str):
         """
@@ -408,13 +905,21 @@ class BaseReader(metaclass=abc.ABCMeta):
         sep: str = ". ",
         size: int = 4000,
         overlap: int = 1000,
-    ) -> list[Document]:
+    ) -> Iterator[Document]:
         r"""
         Split a debate into chunks to be processed by the LLM.
 
         Some of the speeches within a single debate can get very large,
         making them intractable for the LLM.
 
+        We walk through the text in windows of at most `size`
+        characters, ending each window at the last separator inside it
+        (or the last whitespace if there is none). The next window
+        starts after a separator that falls within `overlap` characters
+        of the end of the last one, so chunks share whole sentences
+        where possible. Otherwise, it backs up by `overlap` characters,
+        so no term is lost at the cut.
+
         Parameters
         ----------
         text : str
@@ -422,26 +927,35 @@ class BaseReader(metaclass=abc.ABCMeta):
         sep : str
             Separator to define natural chunks. Defaults to `. `.
         size : int
-            Chunk size to aim for. Defaults to 20,000 tokens.
+            Maximum chunk size in characters. Defaults to 4,000.
         overlap : int
-            Overlap between chunks. Defaults to 4,000 tokens.
+            Overlap between chunks in characters. Defaults to 1,000.
 
         Returns
         -------
-        chunks : list[Document]
-            Chunked-up text for processing.
+        chunks : Iterator[Document]
+            Chunks of text for processing, in order.
+
+        Raises
+        ------
+        ValueError
+            If `size` is not positive or `overlap` is not smaller than
+            `size`.
         """
 
-        splitter = RecursiveCharacterTextSplitter(
-            separators=sep,
-            chunk_size=size,
-            chunk_overlap=overlap,
-            length_function=len,
-            keep_separator=False,
-            is_separator_regex=False,
+        if size <= 0:
+            raise ValueError(f"Chunk size must be positive, not {size}.")
+        if overlap >= size:
+            raise ValueError(
+                f"Overlap ({overlap}) must be smaller than chunk size ({size})."
+            )
+
+        chunks = (
+            text[start:end].strip()
+            for start, end in _chunk_bounds(text, sep, size, overlap)
         )
 
-        return splitter.create_documents([text])
+        return (Document(page_content=chunk) for chunk in chunks if chunk)
 
     def _analyse_chunk(self, chunk: Document) -> str:
         """
@@ -458,19 +972,128 @@ class BaseReader(metaclass=abc.ABCMeta):
             LLM response, lightly formatted.
         """
 
-        prompt_template = PromptTemplate(
-            input_variables=["keywords", "text"], template=self.prompt
+        return self._analyse_chunks([chunk])[0]
+
+    def _analyse_chunks(self, chunks: list[Document]) -> list[str]:
+        """
+        Extract the relevant content from several chunks using LLM.
+
+        Responses are cached on disk against the model, prompt, search
+        terms, and chunk contents. If we have seen this exact request
+        before, the cached response is used. Any remaining chunks are
+        sent to the LLM together as a single batch.
+
+        Parameters
+        ----------
+        chunks : list[langchain.docstore.document.Document]
+            Documents with the chunk contents to be processed.
+
+        Returns
+        -------
+        responses : list[str]
+            LLM responses, lightly formatted, in the order of `chunks`.
+        """
+
+        keys = list(map(self._make_cache_key, chunks))
+        responses = list(map(self._load_cached_response, keys))
+
+        missing = [i for i, resp in enumerate(responses) if resp is None]
+        self._cache_hits += len(chunks) - len(missing)
+        self._cache_misses += len(missing)
+        if not missing:
+            return responses
+
+        prompts = [self._format_prompt(chunks[i]) for i in missing]
+        outputs = self.llm.batch(
+            prompts, config={"max_concurrency": self._llm_concurrency}
         )
-        prompt = prompt_template.format(
+
+        for i, output in zip(missing, outputs):
+            response = output.content.strip()
+            if self.llm_name == "gemma":
+                response = self.clean_response(response)
+
+            self._cache_response(keys[i], response)
+            responses[i] = response
+
+        return responses
+
+    def _format_prompt(self, chunk: Document) -> str:
+        """
+        Fill in the prompt template for a chunk.
+
+        Parameters
+        ----------
+        chunk : langchain.docstore.document.Document
+            Document with the chunk contents to be processed.
+
+        Returns
+        -------
+        prompt : str
+            Prompt to be sent to the LLM.
+        """
+
+        return self._prompt_template.format(
             keywords=self.terms, text=chunk.page_content
         )
 
-        llm = self.llm
-        response = llm.invoke(prompt).content.strip()
-        if self.llm_name == "gemma":
-            response = self.clean_response(response)
+    def _make_cache_key(self, chunk: Document) -> str:
+        """
+        Create a key to cache the LLM response to a chunk.
 
-        return response
+        Parameters
+        ----------
+        chunk : langchain.docstore.document.Document
+            Document with the chunk contents to be processed.
+
+        Returns
+        -------
+        key : str
+            Hexadecimal SHA-256 digest of the request details.
+        """
+
+        request = "|".join(
+            (self.llm_name, self.prompt, str(self.terms), chunk.page_content)
+        )
+
+        return hashlib.sha256(request.encode()).hexdigest()
+
+    def _load_cached_response(self, key: str) -> None | str:
+        """
+        Load a cached LLM response from disk if there is one.
+
+        Parameters
+        ----------
+        key : str
+            Cache key for the response.
+
+        Returns
+        -------
+        response : None | str
+            Cached response, or `None` if there is no cache entry.
+        """
+
+        path = os.path.join(self._llm_cache_dir, f"{key}.json")
+        if not os.path.exists(path):
+            return None
+
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())["response"]
+
+    def _cache_response(self, key: str, response: str) -> None:
+        """
+        Write an LLM response to the cache.
+
+        Parameters
+        ----------
+        key : str
+            Cache key for the response.
+        response : str
+            LLM response to be cached.
+        """
+
+        path = os.path.join(self._llm_cache_dir, f"{key}.json")
+        _write_atomically(path, orjson.dumps({"response": response}))
 
     def _check_response(self, response: str, chunk: Document) -> bool:
         """Check if LLM response appears verbatim in original text.
@@ -488,23 +1111,12 @@ class BaseReader(metaclass=abc.ABCMeta):
             True/False the LLM response is present exactly in the original.
         """
 
-        # TODO: string formatting function to reduce code
-        original = chunk.page_content.lower()
-        original = re.sub(r"[^\w\s]", "", original)
-
-        passed = False
-
-        for el in response.split(". "):
-            el = el.lower()
-            el = re.sub(r"[^\w\s]", "", el)
+        original = _normalise(chunk.page_content)
 
-            if el.lower() not in original:
-                passed = False
-                return passed
-            else:
-                passed = True
-
-        return passed
+        return all(
+            sentence in original
+            for sentence in map(_normalise, response.split(". "))
+        )
 
     def save(self, page: dict) -> None:
         """
@@ -528,8 +1140,8 @@ class BaseReader(metaclass=abc.ABCMeta):
         where = root if cat is None else os.path.join(root, cat)
         os.makedirs(where, exist_ok=True)
 
-        with open(os.path.join(where, f"{idx}.json"), "w") as f:
-            json.dump(page, f, indent=4)
+        with open(os.path.join(where, f"{idx}.json"), "wb") as f:
+            f.write(orjson.dumps(page, option=orjson.OPT_INDENT_2))
 
     @abc.abstractmethod
     def render(self, transcript: dict) -> str:
@@ -570,21 +1182,12 @@ class BaseReader(metaclass=abc.ABCMeta):
         form = "%a, %d %b %Y"
         today = dt.date.today().strftime(form)
 
-        dates = self.dates
-        if len(dates) == 1:
-            period = dates[-1].strftime(form)
-        else:
-            start = min(dates).strftime(form)
-            end = max(dates).strftime(form)
-            period = f"{start} to {end}"
+        start, end = (date.strftime(form) for date in self._period)
+        period = start if len(self.dates) == 1 else f"{start} to {end}"
 
         urls = urls or self.urls
         source = f"Based on information from {self._source}:\n"
-        links = []
-        for url in urls:
-            parsed = urlparse(url)
-            link = url.replace(f"{parsed.scheme}://", "", 1)
-            links.append(f"- [{link}]({url})")
+        links = (f"- [{self._strip_scheme(url)}]({url})" for url in urls)
 
         header = "\n".join(
             (
@@ -597,3 +1200,25 @@ class BaseReader(metaclass=abc.ABCMeta):
         )
 
         return header
+
+    @staticmethod
+    def _strip_scheme(url: str) -> str:
+        """
+        Remove the scheme from a URL to give its display text.
+
+        Parameters
+        ----------
+        url : str
+            URL to be displayed.
+
+        Returns
+        -------
+        link : str
+            URL without its scheme, e.g. `www.example.com/?id=1`.
+        """
+
+        parsed = urlsplit(url)
+        query = f"?{parsed.query}" if parsed.query else ""
+        fragment = f"#{parsed.fragment}" if parsed.fragment else ""
+
+        return f"{parsed.netloc}{parsed.path}{query}{fragment}"
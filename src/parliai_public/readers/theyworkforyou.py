@@ -3,14 +3,50 @@
 import datetime as dt
 import re
 import warnings
-from typing import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, TypedDict
 
-from bs4 import BeautifulSoup
+import requests
+from bs4 import BeautifulSoup, SoupStrainer
 from bs4.element import NavigableString, Tag
 from langchain_community.chat_models import ChatOllama
 
 from .base import BaseReader
 
+_TITLE_RE = re.compile(r"^.*(?=:\s*\d{1,2} \w{3} \d{4})")
+_PARLI_RE = re.compile(r"(?<=theyworkforyou\.com/)\w+(?=/\?id=)")
+_RECIPIENT_RE = re.compile(r"^.*(?= written question)")
+_ANSWERED_RE = re.compile(r"(?<=on)\s+\d{1,2} \w+ \d{4}")
+# .mh pages list statements already on the daily page
+_ENTRY_HREF_RE = re.compile(r"(?<!\.mh)$")
+
+_NO_SPEAKER = "### No speaker assigned"
+
+_PARLI_LABELS = {
+    "debates": "House of Commons",
+    "lords": "House of Lords",
+    "whall": "Westminster Hall",
+    "wms": "UK Ministerial statement",
+    "senedd": "Senedd / Welsh Parliament",
+    "sp": "Scottish Parliament",
+    "ni": "Northern Ireland Assembly",
+}
+
+
+class _SpeechDetails(TypedDict):
+    """Details of a speech as read from a transcript."""
+
+    name: None | str
+    position: None | str
+    url: None | str
+    text: str
+
+
+class Speech(_SpeechDetails, total=False):
+    """A speech, with the LLM response once it has been analysed."""
+
+    response: str
+
 
 class Debates(BaseReader):
     """
@@ -45,6 +81,13 @@ class Debates(BaseReader):
 
     _default_config = "debates.toml"
     _speech_prefix = "debate-speech__"
+    _block_class = f"{_speech_prefix}speaker-and-content"
+    _speaker_class = f"{_speech_prefix}speaker"
+    _name_class = f"{_speech_prefix}speaker__name"
+    _position_class = f"{_speech_prefix}speaker__position"
+    _content_class = f"{_speech_prefix}content"
+    _listing_attrs = {"class": "business-list__title", "href": _ENTRY_HREF_RE}
+    _listing_strainer = SoupStrainer("a", attrs=_listing_attrs)
     _source = (
         "transcripts taken from "
         "[TheyWorkForYou](https://www.theyworkforyou.com/)"
@@ -65,36 +108,15 @@ class Debates(BaseReader):
 
         return pages
 
-    def _remove_multi_link_statements(
-        self, latest_pages: list[str]
-    ) -> list[str]:
-        """Remove all .mh links.
-
-        Note that these linked pages filter to departmental
-        pages. These individual statements are already listed
-        in the daily pages. This function mitigates that
-        potential duplication.
-
-        Parameters
-        ----------
-        latest_pages : list[str]
-            List of all current URLs, including .mh pages.
-
-        Returns
-        -------
-        latest_pages : list[str]
-            Updated list of URLs.
-        """
-        suffix = ".mh"
-        latest_pages = [
-            page for page in latest_pages if not page.endswith(suffix)
-        ]
-        return latest_pages
-
     def retrieve_latest_entries(self) -> list[str]:
         """
         Pull down all the individual parliamentary entry pages.
 
+        The daily listing pages are fetched concurrently, and any that
+        cannot be retrieved are skipped with a warning. Links to
+        multi-statement (`.mh`) pages are skipped since they only group
+        departmental statements already listed on the daily pages.
+
         Returns
         -------
         entries : list[str]
@@ -103,23 +125,50 @@ class Debates(BaseReader):
 
         latest_pages = self._list_latest_pages()
 
+        def get_listing(url):
+            try:
+                return self.get(
+                    url, check=False, parse_only=self._listing_strainer
+                )
+            except requests.HTTPError as error:
+                warnings.warn(f"Could not read {url}: {error}", UserWarning)
+                return None
+
+        with ThreadPoolExecutor(self._http_concurrency) as executor:
+            soups = executor.map(get_listing, latest_pages)
+
         entries = []
-        for url in latest_pages:
-            soup = self.get(url, check=False)
+        for soup in soups:
             if soup is not None:
-                links = soup.find_all(
-                    "a", attrs={"class": "business-list__title"}
+                links = soup.find_all("a", attrs=self._listing_attrs)
+                entries.extend(
+                    f"https://theyworkforyou.com{link['href']}"
+                    for link in links
                 )
-                for link in links:
-                    entries.append(
-                        f"https://theyworkforyou.com{link.get('href')}"
-                    )
-
-        # remove .mh multi-statement references
-        entries = self._remove_multi_link_statements(entries)
 
         return entries
 
+    def _is_settled(self, url: str) -> bool:
+        """
+        Determine whether an entry is from before today.
+
+        Transcripts for past days do not change, but today's may still
+        be added to.
+
+        Parameters
+        ----------
+        url : str
+            URL of the entry.
+
+        Returns
+        -------
+        settled : bool
+            Whether the entry is dated before today.
+        """
+
+        *_, idx = url.split("?id=")
+        return idx[:10] < dt.date.today().isoformat()
+
     def _read_metadata(self, url: str, soup: BeautifulSoup) -> dict:
         """
         Extract the title, date, and storage metadata for a debate.
@@ -143,13 +192,21 @@ class Debates(BaseReader):
         -------
         metadata : dict
             Dictionary containing the debate metadata.
+
+        Raises
+        ------
+        ValueError
+            If the entry index does not start with a date.
         """
 
         *_, cat, idx = url.replace("?id=", "").split("/")
 
         block = soup.find("title").get_text()
-        title = re.search(r"^.*(?=:\s*\d{1,2} \w{3} \d{4})", block).group()
-        date = re.search(r"(?<=(\=))\d{4}-\d{2}-\d{2}(?=[\w\.])", url).group()
+        title = _TITLE_RE.search(block).group()
+
+        date = idx[:10]
+        if len(idx) < 10 or date[4] != "-" or date[7] != "-":
+            raise ValueError(f"Entry URL has no date in its index: {url}")
 
         metadata = dict(cat=cat, idx=idx, title=title, date=date, url=url)
 
@@ -194,15 +251,28 @@ class Debates(BaseReader):
             transcript of the debate in plain-text format.
         """
 
-        raw_speeches = soup.find_all(
-            "div", attrs={"class": f"{self._speech_prefix}speaker-and-content"}
-        )
+        return {"speeches": list(self._iter_speeches(soup))}
+
+    def _iter_speeches(self, soup: BeautifulSoup) -> Iterator[Speech]:
+        """
+        Process each speech block in HTML soup in turn.
+
+        Parameters
+        ----------
+        soup : bs4.BeautifulSoup
+            HTML soup of a webpage.
+
+        Returns
+        -------
+        speeches : Iterator[Speech]
+            Processed speeches in the order they appear.
+        """
 
-        speeches = map(self._process_speech, raw_speeches)
+        raw_speeches = soup.find_all("div", attrs={"class": self._block_class})
 
-        return {"speeches": list(speeches)}
+        return map(self._process_speech, raw_speeches)
 
-    def _process_speech(self, speech: BeautifulSoup) -> dict:
+    def _process_speech(self, speech: BeautifulSoup) -> Speech:
         """
         Process a speech block by extracting its details and contents.
 
@@ -217,7 +287,7 @@ class Debates(BaseReader):
 
         Returns
         -------
-        processed : dict
+        processed : Speech
             Dictionary containing the speech components: speaker name,
             speaker position, speaker URL, and the text of the speech.
         """
@@ -225,7 +295,7 @@ class Debates(BaseReader):
         name, position, url = self._extract_speaker_details(speech)
         text = self._extract_speech_text(speech)
 
-        return {"name": name, "position": position, "url": url, "text": text}
+        return Speech(name=name, position=position, url=url, text=text)
 
     def _extract_speaker_details(
         self, speech: BeautifulSoup
@@ -248,24 +318,21 @@ class Debates(BaseReader):
             URL on TWFY of the attributed speaker.
         """
 
-        prefix = self._speech_prefix
-        speaker = speech.find("h2", attrs={"class": f"{prefix}speaker"})
+        speaker = speech.find("h2", attrs={"class": self._speaker_class})
 
         name, position, url = None, None, None
         if isinstance(speaker, Tag):
             name_block = speaker.find(
-                "strong", attrs={"class": f"{prefix}speaker__name"}
+                "strong", attrs={"class": self._name_class}
             )
             position_block = speaker.find(
-                "small", attrs={"class": f"{prefix}speaker__position"}
+                "small", attrs={"class": self._position_class}
             )
             name, position = map(
                 self._get_detail_text, (name_block, position_block)
             )
 
-            href_block = speaker.find(
-                lambda tag: tag.name == "a" and "href" in tag.attrs
-            )
+            href_block = speaker.find("a", href=True)
             url = (
                 f"https://theyworkforyou.com{href_block['href']}"
                 if href_block
@@ -279,11 +346,9 @@ class Debates(BaseReader):
         """
         Try to get the text of a speaker detail.
 
-        The usual behaviour for this function (getting the text of a
-        detail) should only fail when the detail is actually `None` and
-        was not found in `_extract_speaker_details()`. In this scenario,
-        we catch the `AttributeError` and return the detail as it was,
-        i.e. as `None`.
+        The detail is only `None` when it was not found in
+        `_extract_speaker_details()`, which happens for any speech
+        without an attributed speaker. In that case, we return `None`.
 
         Parameters
         ----------
@@ -297,17 +362,12 @@ class Debates(BaseReader):
             Text from the detail or `None`.
         """
 
-        try:
-            return detail.get_text()
-        except AttributeError:
-            pass
+        return None if detail is None else detail.get_text()
 
     def _extract_speech_text(self, speech: BeautifulSoup) -> str:
         """Get the text of a speech back."""
 
-        text = speech.find(
-            "div", attrs={"class": f"{self._speech_prefix}content"}
-        )
+        text = speech.find("div", attrs={"class": self._content_class})
 
         return text.get_text().strip()
 
@@ -315,6 +375,10 @@ class Debates(BaseReader):
         """
         Analyse all relevant speeches on a page.
 
+        Most pages do not mention any search terms, so we check the
+        whole page once before checking each speech. The relevant
+        speeches are then analysed in a single batch.
+
         Parameters
         ----------
         page : dict
@@ -326,19 +390,29 @@ class Debates(BaseReader):
             Debate transcript with LLM responses attached.
         """
 
-        for speech in page["speeches"]:
-            if self.check_contains_terms(speech["text"]):
-                speech = super().analyse(speech)
+        text = "\n".join(speech["text"] for speech in page["speeches"])
+        if not self.check_contains_terms(text):
+            return page
+
+        relevant = [
+            speech
+            for speech in page["speeches"]
+            if self.check_contains_terms(speech["text"])
+        ]
+        self.analyse_many(relevant)
 
         return page
 
-    def parliament_label(self, url: str) -> str:
+    def parliament_label(self, url: str, cat: None | str = None) -> str:
         """Label debates with parliament name.
 
         Parameters
         ----------
         url : str
             URL of debate content.
+        cat : str, optional
+            Category of the debate, as read into its metadata. If not
+            specified, the category is taken from the URL.
 
         Returns
         -------
@@ -346,21 +420,13 @@ class Debates(BaseReader):
             Name of parliament/chamber in which debate occurred.
         """
 
-        parli_labels = {
-            "debates": "House of Commons",
-            "lords": "House of Lords",
-            "whall": "Westminster Hall",
-            "wms": "UK Ministerial statement",
-            "senedd": "Senedd / Welsh Parliament",
-            "sp": "Scottish Parliament",
-            "ni": "Northern Ireland Assembly",
-        }
+        if cat is None:
+            tag = _PARLI_RE.search(url)
+            if tag is None:
+                return "Unclassified"
+            cat = tag.group()
 
-        tag = re.search(r"(?<=theyworkforyou.com\/)\w+(?=\/\?id\=)", url)
-        if tag is None:
-            return "Unclassified"
-
-        return parli_labels[tag.group()]
+        return _PARLI_LABELS.get(cat, "Unclassified")
 
     def render(self, transcript: dict) -> str:
         """
@@ -377,10 +443,10 @@ class Debates(BaseReader):
             Stylised summary of the entry in Markdown syntax.
         """
 
-        label = self.parliament_label(transcript["url"])
+        label = self.parliament_label(transcript["url"], transcript.get("cat"))
 
         title = f"## {label}: [{transcript['title']}]({transcript['url']})"
-        processed = []
+        processed = [title]
         for speech in transcript["speeches"]:
             if "response" in speech:
                 if speech["name"]:
@@ -388,17 +454,12 @@ class Debates(BaseReader):
                         f"### [{speech['name']}]({speech['url']})"
                         f" ({speech['position']})"
                     )
-                    processed.append(
-                        "\n\n".join((speaker, speech["response"]))
-                    )
                 else:
                     # if no speaker, return placeholder and response
-                    speaker = "### No speaker assigned"
-                    processed.append(
-                        "\n\n".join((speaker, speech["response"]))
-                    )
+                    speaker = _NO_SPEAKER
+                processed.append(f"{speaker}\n\n{speech['response']}")
 
-        return "\n\n".join((title, *processed))
+        return "\n\n".join(processed)
 
 
 class WrittenAnswers(Debates):
@@ -524,9 +585,9 @@ class WrittenAnswers(Debates):
 
         lead = soup.find("p", attrs={"class": "lead"}).get_text().strip()
 
-        recipient = re.search(r"^.*(?= written question)", lead).group()
+        recipient = _RECIPIENT_RE.search(lead).group()
 
-        on = re.search(r"(?<=on)\s+\d{1,2} \w+ \d{4}", lead).group().strip()
+        on = _ANSWERED_RE.search(lead).group().strip()
         on = dt.datetime.strptime(on, "%d %B %Y").date().isoformat()
 
         return recipient, on
@@ -547,8 +608,7 @@ class WrittenAnswers(Debates):
             plain-text response to the question.
         """
 
-        contents = super()._read_contents(soup)
-        *questions, answer = contents["speeches"]
+        *questions, answer = self._iter_speeches(soup)
 
         return {"questions": questions, "answer": answer}
 
@@ -600,7 +660,7 @@ class WrittenAnswers(Debates):
                 f"({question['position']})"
             )
             question_text = question["text"].strip()
-            questions.append("\n\n".join((question_title, question_text)))
+            questions.append(f"{question_title}\n\n{question_text}")
 
         addressed = f"Addressed to: {transcript['recipient']}."
         asked = f"Asked on: {transcript['date']}."
@@ -641,6 +701,6 @@ class WrittenAnswers(Debates):
             "response", "Answer does not mention any search terms."
         )
 
-        processed = "\n\n".join((title, response))
+        processed = f"{title}\n\n{response}"
 
         return processed
@@ -6,14 +6,22 @@ taken on 2024-03-06.
 """
 
 import datetime as dt
+import functools
 import string
 
 from dateutil import relativedelta as rd
+from hypothesis import Phase, settings
 from hypothesis import strategies as st
 from langchain_community.chat_models import ChatOllama
 
 from parliai_public.readers.base import BaseReader
 
+# Fewer, reproducible examples for tests whose invariants are coarse
+# but whose examples are slow (disk I/O, config parsing, splitting).
+HEAVY_SETTINGS = settings(
+    max_examples=25, derandomize=True, phases=(Phase.explicit, Phase.generate)
+)
+
 
 class ToyReader(BaseReader):
     """A toy class to allow testing our abstract base class."""
@@ -36,6 +44,7 @@ class ToyReader(BaseReader):
         """Allow testing with toy method."""
 
 
+@functools.lru_cache(maxsize=8)
 def where_what(reader):
     """Get the right location and class for testing a reader."""
 
@@ -43,7 +52,7 @@ def where_what(reader):
     if reader is ToyReader:
         what = BaseReader
 
-    where = ".".join((what.__module__, what.__name__))
+    where = f"{what.__module__}.{what.__name__}"
 
     return where, what
 
@@ -0,0 +1,36 @@
+"""Test configuration shared across the whole suite."""
+
+import os
+
+from hypothesis import HealthCheck, settings
+from hypothesis.database import DirectoryBasedExampleDatabase
+
+_SHARED = {
+    "deadline": None,
+    "suppress_health_check": (
+        HealthCheck.too_slow,
+        HealthCheck.data_too_large,
+    ),
+}
+
+# Give each pytest-xdist worker its own example database
+_WORKER = os.getenv("PYTEST_XDIST_WORKER")
+if _WORKER is not None:
+    _SHARED["database"] = DirectoryBasedExampleDatabase(
+        f".hypothesis/{_WORKER}"
+    )
+
+settings.register_profile("ci", max_examples=50, **_SHARED)
+settings.register_profile("dev", max_examples=20, **_SHARED)
+settings.register_profile("nightly", max_examples=500, **_SHARED)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "ci"))
+
+
+def pytest_addoption(parser):
+    """Add an option to re-record the pages used by example tests."""
+
+    parser.addoption(
+        "--record-pages",
+        action="store_true",
+        help="Fetch example pages live and save them for later replay.",
+    )
@@ -26,6 +26,6 @@ def test_81_add_ons_not_matched():
     url = "https://theyworkforyou.com/wrans/?id=2024-04-12.21381.h"
 
     response = requests.get(url)
-    soup = BeautifulSoup(response.content, "html.parser")
+    soup = BeautifulSoup(response.content, "lxml")
 
     assert not reader.check_contains_terms(soup.get_text())
@@ -3,17 +3,48 @@
 import datetime as dt
 from unittest import mock
 
+import pytest
 from hypothesis import HealthCheck, given, provisional, settings
 from hypothesis import strategies as st
 
 from parliai_public.readers import Debates, WrittenAnswers
+from parliai_public.readers.base import BaseReader
 
-from ..common import ST_DATES, ST_FREE_TEXT, TODAY, ToyReader, where_what
+from ..common import (
+    HEAVY_SETTINGS,
+    ST_DATES,
+    ST_FREE_TEXT,
+    TODAY,
+    ToyReader,
+    where_what,
+)
 
 ST_OPTIONAL_STRINGS = st.one_of((st.just(None), ST_FREE_TEXT))
 YESTERDAY = TODAY - dt.timedelta(days=1)
 
 
+@pytest.fixture(scope="module")
+def config_mocks():
+    """
+    Patch the config loader and date lister once for the module.
+
+    Hypothesis runs each test many times, so rather than patching per
+    example, this gives a function that hands back both mocks reset.
+    """
+
+    loader, lister = mock.MagicMock(), mock.MagicMock()
+
+    def reset():
+        loader.reset_mock()
+        lister.reset_mock()
+        return loader, lister
+
+    with pytest.MonkeyPatch.context() as patcher:
+        patcher.setattr(BaseReader, "_load_config", loader)
+        patcher.setattr("parliai_public.dates.list_dates", lister)
+        yield reset
+
+
 @settings(suppress_health_check=(HealthCheck.too_slow,))
 @given(
     st.sampled_from((ToyReader, Debates, WrittenAnswers)),
@@ -50,6 +81,7 @@ def test_init(reader_class, urls, terms, dates, outdir, prompt):
     load.assert_called_once_with()
 
 
+@HEAVY_SETTINGS
 @given(
     st.sampled_from((ToyReader, Debates, WrittenAnswers)),
     ST_OPTIONAL_STRINGS,
@@ -57,7 +89,9 @@ def test_init(reader_class, urls, terms, dates, outdir, prompt):
     st.lists(ST_FREE_TEXT, max_size=5),
     ST_FREE_TEXT,
 )
-def test_from_toml_no_dates(reader_class, path, urls, terms, text):
+def test_from_toml_no_dates(
+    config_mocks, reader_class, path, urls, terms, text
+):
     """
     Test that an instance can be made from a configuration file.
 
@@ -66,22 +100,19 @@ def test_from_toml_no_dates(reader_class, path, urls, terms, text):
     yesterday.
     """
 
-    where, what = where_what(reader_class)
+    _, what = where_what(reader_class)
     if reader_class is WrittenAnswers:
         urls = reader_class._supported_urls
 
-    with (
-        mock.patch(f"{where}._load_config") as loader,
-        mock.patch("parliai_public.dates.list_dates") as lister,
-    ):
-        loader.return_value = {
-            "urls": urls,
-            "terms": terms,
-            "outdir": text,
-            "prompt": text,
-            "llm_name": "gemma",
-        }
-        reader = reader_class.from_toml(path)
+    loader, lister = config_mocks()
+    loader.return_value = {
+        "urls": urls,
+        "terms": terms,
+        "outdir": text,
+        "prompt": text,
+        "llm_name": "gemma",
+    }
+    reader = reader_class.from_toml(path)
 
     assert isinstance(reader, what)
     assert reader.dates == [YESTERDAY]
@@ -92,30 +123,28 @@ def test_from_toml_no_dates(reader_class, path, urls, terms, text):
     lister.assert_not_called()
 
 
+@HEAVY_SETTINGS
 @given(
     st.sampled_from((ToyReader, Debates, WrittenAnswers)),
     ST_DATES.map(dt.date.isoformat),
 )
-def test_from_toml_with_start(reader_class, start):
+def test_from_toml_with_start(config_mocks, reader_class, start):
     """
     Check the config constructor works with a start date.
 
     The actual date list construction is mocked here.
     """
-    where, what = where_what(reader_class)
+    _, what = where_what(reader_class)
 
-    with (
-        mock.patch(f"{where}._load_config") as loader,
-        mock.patch("parliai_public.dates.list_dates") as lister,
-    ):
-        loader.return_value = {
-            "urls": [],
-            "start": start,
-            "prompt": "",
-            "llm_name": "gemma",
-        }
-        lister.return_value = ["dates"]
-        reader = reader_class.from_toml()
+    loader, lister = config_mocks()
+    loader.return_value = {
+        "urls": [],
+        "start": start,
+        "prompt": "",
+        "llm_name": "gemma",
+    }
+    lister.return_value = ["dates"]
+    reader = reader_class.from_toml()
 
     assert isinstance(reader, what)
     assert reader.dates == ["dates"]
@@ -126,27 +155,25 @@ def test_from_toml_with_start(reader_class, start):
     lister.assert_called_once_with(start, None, None, "%Y-%m-%d")
 
 
+@HEAVY_SETTINGS
 @given(
     st.sampled_from((ToyReader, Debates, WrittenAnswers)),
     ST_DATES.map(dt.date.isoformat),
 )
-def test_from_toml_with_end(reader_class, end):
+def test_from_toml_with_end(config_mocks, reader_class, end):
     """Check the config constructor works with an end date."""
 
-    where, what = where_what(reader_class)
+    _, what = where_what(reader_class)
 
-    with (
-        mock.patch(f"{where}._load_config") as loader,
-        mock.patch("parliai_public.dates.list_dates") as lister,
-    ):
-        loader.return_value = {
-            "urls": [],
-            "end": end,
-            "prompt": "",
-            "llm_name": "gemma",
-        }
-        lister.return_value = ["dates"]
-        reader = reader_class.from_toml()
+    loader, lister = config_mocks()
+    loader.return_value = {
+        "urls": [],
+        "end": end,
+        "prompt": "",
+        "llm_name": "gemma",
+    }
+    lister.return_value = ["dates"]
+    reader = reader_class.from_toml()
 
     assert isinstance(reader, what)
     assert reader.dates == ["dates"]
@@ -157,31 +184,29 @@ def test_from_toml_with_end(reader_class, end):
     lister.assert_called_once_with(None, end, None, "%Y-%m-%d")
 
 
+@HEAVY_SETTINGS
 @given(
     st.sampled_from((ToyReader, Debates, WrittenAnswers)),
     st.tuples(ST_DATES, ST_DATES).map(
         lambda dates: sorted(map(dt.date.isoformat, dates))
     ),
 )
-def test_from_toml_with_endpoints(reader_class, endpoints):
+def test_from_toml_with_endpoints(config_mocks, reader_class, endpoints):
     """Check the config constructor works with two endpoints."""
 
-    where, what = where_what(reader_class)
+    _, what = where_what(reader_class)
     start, end = endpoints
 
-    with (
-        mock.patch(f"{where}._load_config") as loader,
-        mock.patch("parliai_public.dates.list_dates") as lister,
-    ):
-        loader.return_value = {
-            "urls": [],
-            "start": start,
-            "end": end,
-            "prompt": "",
-            "llm_name": "gemma",
-        }
-        lister.return_value = ["dates"]
-        reader = reader_class.from_toml()
+    loader, lister = config_mocks()
+    loader.return_value = {
+        "urls": [],
+        "start": start,
+        "end": end,
+        "prompt": "",
+        "llm_name": "gemma",
+    }
+    lister.return_value = ["dates"]
+    reader = reader_class.from_toml()
 
     assert isinstance(reader, what)
     assert reader.dates == ["dates"]
@@ -193,27 +218,25 @@ def test_from_toml_with_endpoints(reader_class, endpoints):
     lister.assert_called_once_with(start, end, None, "%Y-%m-%d")
 
 
+@HEAVY_SETTINGS
 @given(
     st.sampled_from((ToyReader, Debates, WrittenAnswers)),
     st.integers(1, 14),
 )
-def test_from_toml_with_window(reader_class, window):
+def test_from_toml_with_window(config_mocks, reader_class, window):
     """Check the config constructor works with a window."""
 
-    where, what = where_what(reader_class)
+    _, what = where_what(reader_class)
 
-    with (
-        mock.patch(f"{where}._load_config") as loader,
-        mock.patch("parliai_public.dates.list_dates") as lister,
-    ):
-        loader.return_value = {
-            "urls": [],
-            "window": window,
-            "prompt": "",
-            "llm_name": "gemma",
-        }
-        lister.return_value = ["dates"]
-        reader = reader_class.from_toml()
+    loader, lister = config_mocks()
+    loader.return_value = {
+        "urls": [],
+        "window": window,
+        "prompt": "",
+        "llm_name": "gemma",
+    }
+    lister.return_value = ["dates"]
+    reader = reader_class.from_toml()
 
     assert isinstance(reader, what)
     assert reader.dates == ["dates"]
@@ -224,29 +247,29 @@ def test_from_toml_with_window(reader_class, window):
     lister.assert_called_once_with(None, None, window, "%Y-%m-%d")
 
 
+@HEAVY_SETTINGS
 @given(
     st.sampled_from((ToyReader, Debates, WrittenAnswers)),
     ST_DATES.map(dt.date.isoformat),
     st.integers(1, 14),
 )
-def test_from_toml_with_end_and_window(reader_class, end, window):
+def test_from_toml_with_end_and_window(
+    config_mocks, reader_class, end, window
+):
     """Check the config constructor works with an end and a window."""
 
-    where, what = where_what(reader_class)
+    _, what = where_what(reader_class)
 
-    with (
-        mock.patch(f"{where}._load_config") as loader,
-        mock.patch("parliai_public.dates.list_dates") as lister,
-    ):
-        loader.return_value = {
-            "urls": [],
-            "end": end,
-            "window": window,
-            "prompt": "",
-            "llm_name": "gemma",
-        }
-        lister.return_value = ["dates"]
-        reader = reader_class.from_toml()
+    loader, lister = config_mocks()
+    loader.return_value = {
+        "urls": [],
+        "end": end,
+        "window": window,
+        "prompt": "",
+        "llm_name": "gemma",
+    }
+    lister.return_value = ["dates"]
+    reader = reader_class.from_toml()
 
     assert isinstance(reader, what)
     assert reader.dates == ["dates"]
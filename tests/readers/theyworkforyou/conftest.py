@@ -0,0 +1,49 @@
+"""Fixtures for the TheyWorkForYou reader tests."""
+
+import pathlib
+from unittest import mock
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+import requests
+
+PAGES = pathlib.Path(__file__).parent / "_pages"
+
+
+@pytest.fixture
+def recorded_pages(request, monkeypatch):
+    """
+    Serve entry pages from disk rather than over the network.
+
+    Each page is stored under `_pages/` by its entry index. A test that
+    needs a page which has not been recorded fails, rather than going
+    to the network or quietly skipping. Pass `--record-pages` to fetch
+    every page live and save it for replay.
+    """
+
+    record = request.config.getoption("--record-pages")
+    live_request = requests.Session.request
+
+    def replay(session, method, url, *args, **kwargs):
+        (idx,) = parse_qs(urlsplit(url).query)["id"]
+        path = PAGES / f"{idx}.html"
+
+        if path.exists() and not record:
+            page = mock.MagicMock(status_code=200, headers={})
+            page.content = path.read_bytes()
+            return page
+
+        if not record:
+            pytest.fail(
+                f"No recording of {idx} in {PAGES}; run with --record-pages"
+                " to save it, then commit it."
+            )
+
+        page = live_request(session, method, url, *args, **kwargs)
+        if page.status_code == 200:
+            PAGES.mkdir(exist_ok=True)
+            path.write_bytes(page.content)
+
+        return page
+
+    monkeypatch.setattr(requests.Session, "request", replay)
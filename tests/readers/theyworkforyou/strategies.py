@@ -1,43 +1,69 @@
 """Test strategies for the `Debates` class."""
 
+import datetime as dt
+import itertools
 import re
 import string
+import uuid
 
-from bs4 import BeautifulSoup, NavigableString, Tag
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer, Tag
 from hypothesis import provisional
 from hypothesis import strategies as st
 
-from ...common import GOV_DEPARTMENTS, MPS_SAMPLE, ST_DATES, ST_FREE_TEXT
+from ...common import (
+    GOV_DEPARTMENTS,
+    MPS_SAMPLE,
+    ST_DATES,
+    TODAY,
+)
 
+_PARSER = "lxml"
+_HREF_RE = re.compile(r"(?<=.com)\/\w+\/\d+(?=\/)")
 
-@st.composite
-def st_title_blocks(draw, date=None):
-    """Create text for a title block in a parliamentary entry."""
+# Short free text keeps the transcripts, and the soups made from them,
+# cheap to build and parse
+_ST_TEXT = st.text(
+    string.ascii_letters + string.digits + ".:;!?-", min_size=1, max_size=32
+)
+_ST_MP = st.sampled_from(MPS_SAMPLE)
+_ST_DEPT = st.sampled_from(GOV_DEPARTMENTS)
+_ST_CAT = st.sampled_from(("lords", "debates", "whall"))
+_ST_TAG_NAME = st.sampled_from(("a", "h1", "h2", "strong", "small", "p"))
+_ST_BOARD_HREF = st.tuples(
+    st.text(string.digits + string.ascii_letters, min_size=1, max_size=5),
+    st.sampled_from((".h", ".mh")),
+).map(lambda x: f"/debates/{''.join(x)}")
 
-    if date is None:
-        date = draw(ST_DATES)
 
-    title = draw(ST_FREE_TEXT)
-    extra = draw(ST_FREE_TEXT)
+# Keep only the elements the readers look for, without the html/body
+# wrappers a full parse would add around each fragment
+_SPEECH_STRAINER = SoupStrainer(
+    "div", attrs={"class": "debate-speech__speaker-and-content"}
+)
+_LISTING_STRAINER = SoupStrainer("a", attrs={"class": "business-list__title"})
 
-    block = ": ".join((title, date.strftime("%d %b %Y"), extra))
 
-    return block
+def make_soup(html, parse_only=None):
+    """
+    Parse some HTML into soup with the readers' parser.
 
+    Every call gives a fresh soup. Reading a page decomposes its soup,
+    so soups must never be shared between examples.
+    """
 
-@st.composite
-def st_indices(draw, date=None):
-    """Create an index for a parliamentary entry."""
+    return BeautifulSoup(html, _PARSER, parse_only=parse_only)
+
+
+def build_title_block(title, date, extra):
+    """Build the text for a title block in a parliamentary entry."""
 
-    if date is None:
-        date = draw(ST_DATES)
+    return ": ".join((title, date.strftime("%d %b %Y"), extra))
 
-    prefix = draw(st.text(alphabet="abc", max_size=1))
-    body = draw(st.integers(0, 10).map(str))
 
-    idx = ".".join((date.strftime("%Y-%m-%d"), prefix, body, "h"))
+def build_index(date, prefix, body):
+    """Build an index for a parliamentary entry."""
 
-    return idx
+    return ".".join((date.strftime("%Y-%m-%d"), prefix, str(body), "h"))
 
 
 @st.composite
@@ -45,10 +71,14 @@ def st_metadatas(draw):
     """Create a metadata block for our parliamentary summary tests."""
 
     date = draw(ST_DATES)
-    block = draw(st_title_blocks(date))
-    idx = draw(st_indices(date))
+    block = build_title_block(draw(_ST_TEXT), date, draw(_ST_TEXT))
+    idx = build_index(
+        date,
+        draw(st.text(alphabet="abc", max_size=1)),
+        draw(st.integers(0, 10)),
+    )
 
-    cat = draw(st.sampled_from(("lords", "debates", "whall")))
+    cat = draw(_ST_CAT)
     url = "/".join((draw(provisional.urls()), cat, f"?id={idx}"))
 
     return block, date, idx, cat, url
@@ -59,7 +89,7 @@ def st_lead_metadatas(draw):
     """Create a lead block for a written answer test."""
 
     date = draw(ST_DATES)
-    recipient = draw(st.sampled_from(GOV_DEPARTMENTS))
+    recipient = draw(_ST_DEPT)
 
     lead = (
         f"{recipient} written question "
@@ -73,8 +103,8 @@ def st_lead_metadatas(draw):
 def st_speeches(draw):
     """Create a speech and its details for a parliamentary test."""
 
-    speaker, position, url = draw(st.sampled_from(MPS_SAMPLE))
-    speech = draw(ST_FREE_TEXT)
+    speaker, position, url = draw(_ST_MP)
+    speech = draw(_ST_TEXT)
 
     return speech, speaker, position, url
 
@@ -85,16 +115,11 @@ def st_daily_boards(draw):
 
     date = draw(st.dates()).strftime("%Y-%m-%d")
     url = f"https://theyworkforyou.com/debates/?d={date}"
-
-    st_href = st.text(
-        string.digits + string.ascii_letters, min_size=1, max_size=5
-    ).map(lambda x: f"/debates/{x}.h")
-
-    hrefs = draw(st.lists(st_href, min_size=1, max_size=10))
+    hrefs = draw(st.lists(_ST_BOARD_HREF, min_size=1, max_size=10))
     tags = [
         f'<a href={href} class="business-list__title"></a>' for href in hrefs
     ]
-    soup = BeautifulSoup("\n".join(tags), "html.parser")
+    soup = make_soup("\n".join(tags), _LISTING_STRAINER)
 
     return url, hrefs, soup
 
@@ -102,7 +127,7 @@ def st_daily_boards(draw):
 def extract_href(url):
     """Extract just the hyperlink reference from a URL."""
 
-    match = re.search(r"(?<=.com)\/\w+\/\d+(?=\/)", url)
+    match = _HREF_RE.search(url)
 
     if match is None:
         return url
@@ -113,17 +138,17 @@ def extract_href(url):
 def format_speech_block(name, pos, href, text):
     """Get a speech block into HTML format."""
 
-    html = '<div class="debate-speech__speaker-and-content">'
-    html += '<h2 class="debate-speech__speaker">'
-    html += f'<a href="{href}">'
-    html += f'<strong class="debate-speech__speaker__name">{name}</strong>'
-    html += f'<small class="debate-speech__speaker__position">{pos}</small>'
-    html += "</a>"
-    html += "</h2>"
-    html += f'<div class="debate-speech__content"><p>{text}</p></div>'
-    html += "</div>"
-
-    return html
+    return (
+        '<div class="debate-speech__speaker-and-content">'
+        '<h2 class="debate-speech__speaker">'
+        f'<a href="{href}">'
+        f'<strong class="debate-speech__speaker__name">{name}</strong>'
+        f'<small class="debate-speech__speaker__position">{pos}</small>'
+        "</a>"
+        "</h2>"
+        f'<div class="debate-speech__content"><p>{text}</p></div>'
+        "</div>"
+    )
 
 
 @st.composite
@@ -134,7 +159,7 @@ def st_speech_soups(draw):
     href = extract_href(url)
     html = format_speech_block(name, pos, href, text)
 
-    return BeautifulSoup(html, "html.parser"), name, pos, href, text
+    return make_soup(html, _SPEECH_STRAINER), name, pos, href, text
 
 
 @st.composite
@@ -143,33 +168,34 @@ def st_debate_soups(draw):
 
     speakers = draw(
         st.lists(
-            st.sampled_from(MPS_SAMPLE),
+            _ST_MP,
             min_size=2,
-            max_size=10,
+            max_size=5,
             unique=True,
         )
     )
 
-    names, positions, hrefs, texts = [], [], [], []
-    html = ""
+    names, positions, hrefs, texts, blocks = [], [], [], [], []
     for name, pos, url in speakers:
         href = extract_href(url)
-        text = draw(ST_FREE_TEXT)
+        text = draw(_ST_TEXT)
         names.append(name)
         positions.append(pos)
         hrefs.append(href)
         texts.append(text)
 
-        html += format_speech_block(name, pos, href, text)
+        blocks.append(format_speech_block(name, pos, href, text))
 
-    return BeautifulSoup(html, "html.parser"), names, positions, hrefs, texts
+    html = "".join(blocks)
+
+    return make_soup(html, _SPEECH_STRAINER), names, positions, hrefs, texts
 
 
 @st.composite
 def st_tags(draw):
     """Create a tag for processing."""
 
-    name = draw(st.sampled_from(("a", "h1", "h2", "strong", "small", "p")))
+    name = draw(_ST_TAG_NAME)
     text = draw(st.text(string.ascii_letters + string.digits, min_size=1))
 
     tag = Tag(name=name)
@@ -178,33 +204,50 @@ def st_tags(draw):
     return tag, text
 
 
-@st.composite
-def st_entry_urls(
-    draw, categories=("debates", "lords", "whall", "wms", "senedd", "sp", "ni")
-):
-    """Create a realistic URL for an entry."""
+CATEGORIES = ("debates", "lords", "whall", "wms", "senedd", "sp", "ni")
+_ENTRY_DATES = (
+    TODAY,
+    TODAY - dt.timedelta(days=1),
+    TODAY - dt.timedelta(days=365),
+    TODAY - dt.timedelta(days=4 * 365),
+)
+_ENTRY_IDS = tuple(str(uuid.UUID(int=i)) for i in range(3))
 
-    category = draw(st.sampled_from(categories))
-    date = draw(ST_DATES)
-    idx = draw(st.uuids().map(str))
-    index = f"?id={date}.{idx}"
 
-    elements = filter(None, (category, index))
+def build_entry_url(category, date, idx):
+    """Build the URL for an entry, leaving out a missing category."""
+
+    elements = filter(None, (category, f"?id={date}.{idx}"))
 
     return "/".join(("https://theyworkforyou.com", *elements))
 
 
+_ENTRY_URLS = {
+    category: tuple(
+        build_entry_url(category, date, idx)
+        for date, idx in itertools.product(_ENTRY_DATES, _ENTRY_IDS)
+    )
+    for category in (*CATEGORIES, None)
+}
+
+
+def st_entry_urls(categories=CATEGORIES):
+    """Sample a realistic URL for an entry from a prebuilt table."""
+
+    return st.sampled_from(
+        [url for category in categories for url in _ENTRY_URLS[category]]
+    )
+
+
 @st.composite
-def st_debate_transcripts(draw, max_size=10):
+def st_debate_transcripts(draw, max_size=5):
     """Create a transcript dictionary for a debate."""
 
-    speakers = draw(
-        st.lists(st.sampled_from(MPS_SAMPLE), min_size=2, max_size=max_size)
-    )
+    speakers = draw(st.lists(_ST_MP, min_size=2, max_size=max_size))
 
     speeches = []
     for name, position, url in speakers:
-        text = draw(ST_FREE_TEXT)
+        text = draw(_ST_TEXT)
         speech = {
             "name": name,
             "position": position,
@@ -215,7 +258,7 @@ def st_debate_transcripts(draw, max_size=10):
         speeches.append(speech)
 
     transcript = {
-        "title": draw(ST_FREE_TEXT),
+        "title": draw(_ST_TEXT),
         "url": draw(provisional.urls()),
         "speeches": speeches,
     }
@@ -223,6 +266,17 @@ def st_debate_transcripts(draw, max_size=10):
     return transcript
 
 
+@st.composite
+def st_debate_analyses(draw):
+    """Create a debate transcript and a relevance flag per speech."""
+
+    transcript = draw(st_debate_transcripts())
+    size = len(transcript["speeches"])
+    contains = draw(st.lists(st.booleans(), min_size=size, max_size=size))
+
+    return contains, transcript
+
+
 @st.composite
 def st_written_transcripts(draw):
     """Create a transcript dictionary for a written answer entry."""
@@ -233,7 +287,7 @@ def st_written_transcripts(draw):
     transcript["questions"] = questions
     transcript["answer"] = answer
 
-    transcript["recipient"] = draw(st.sampled_from(GOV_DEPARTMENTS))
+    transcript["recipient"] = draw(_ST_DEPT)
 
     date = draw(st.dates()).isoformat()
     transcript["date"] = date
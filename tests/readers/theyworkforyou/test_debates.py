@@ -1,16 +1,24 @@
 """Unit tests for the `theyworkforyou` module."""
 
+import datetime as dt
+import html
+from collections import Counter
 from unittest import mock
 
+import pytest
 from bs4 import BeautifulSoup, Tag
 from hypothesis import given, provisional, settings
 from hypothesis import strategies as st
 
 from parliai_public import Debates
 
-from ...common import ST_DATES
+from ...common import ST_DATES, TODAY
 from .strategies import (
+    CATEGORIES,
+    build_entry_url,
+    make_soup,
     st_daily_boards,
+    st_debate_analyses,
     st_debate_soups,
     st_debate_transcripts,
     st_entry_urls,
@@ -19,8 +27,15 @@ from .strategies import (
     st_tags,
 )
 
-settings.register_profile("ci", deadline=None)
-settings.load_profile("ci")
+_LABEL_LOOKUP = {
+    "debates": "House of Commons",
+    "lords": "House of Lords",
+    "whall": "Westminster Hall",
+    "wms": "UK Ministerial statement",
+    "senedd": "Senedd / Welsh Parliament",
+    "sp": "Scottish Parliament",
+    "ni": "Northern Ireland Assembly",
+}
 
 
 def mocked_debates(
@@ -52,6 +67,14 @@ def mocked_debates(
     return reader
 
 
+@pytest.fixture(scope="module")
+def reader():
+    """Share one default debates reader between examples and tests."""
+
+    return mocked_debates()
+
+
+@settings(max_examples=25)
 @given(
     st.lists(provisional.urls(), min_size=1, max_size=5, unique=True),
     st.lists(ST_DATES, min_size=1, unique=True),
@@ -67,36 +90,12 @@ def test_list_latest_pages(urls, dates):
     assert all(isinstance(page, str) for page in pages)
     assert len(pages) == len(urls) * len(dates)
 
-    for date in dates:
-        hits = sum(page.endswith(date.isoformat()) for page in pages)
-        assert hits == len(urls)
-
-
-@given(
-    st.lists(
-        st.tuples(st.text(min_size=1), st.sampled_from(("", ".mh"))),
-        min_size=1,
-    )
-)
-def test_remove_multi_link_statements(parts):
-    """Test the method for removing those that end with `.mh`."""
-
-    reader = mocked_debates()
-    pages = ["".join(pair) for pair in parts]
+    hits = Counter(page.rsplit("?d=", 1)[-1] for page in pages)
+    assert hits == {date.isoformat(): len(urls) for date in dates}
 
-    filtered = reader._remove_multi_link_statements(pages)
 
-    assert isinstance(filtered, list)
-    assert all(isinstance(page, str) for page in filtered)
-    for page in pages:
-        if page.endswith(".mh"):
-            assert page not in filtered
-        else:
-            assert page in filtered
-
-
-@given(st.lists(st_daily_boards(), min_size=1))
-def test_retrieve_latest_entries(boards):
+@given(st.lists(st_daily_boards(), min_size=1, unique_by=lambda b: b[0]))
+def test_retrieve_latest_entries(reader, boards):
     """Test the core link retriever."""
 
     urls, hrefs, soups = [], [], []
@@ -105,20 +104,21 @@ def test_retrieve_latest_entries(boards):
         hrefs.extend(href)
         soups.append(soup)
 
-    reader = mocked_debates()
+    pages, calls = dict(zip(urls, soups)), []
+
+    def get(self, url, **kwargs):
+        calls.append((url, kwargs))
+        return pages[url]
 
     with (
         mock.patch("parliai_public.Debates._list_latest_pages") as llp,
-        mock.patch("parliai_public.Debates.get") as get,
-        mock.patch(
-            "parliai_public.Debates._remove_multi_link_statements"
-        ) as rms,
+        mock.patch("parliai_public.Debates.get", get),
     ):
         llp.return_value = urls
-        get.side_effect = soups
-        rms.side_effect = lambda x: x
         entries = reader.retrieve_latest_entries()
 
+    hrefs = [href for href in hrefs if not href.endswith(".mh")]
+
     assert isinstance(entries, list)
     assert len(entries) == len(hrefs)
     for entry, href in zip(entries, hrefs):
@@ -127,24 +127,17 @@ def test_retrieve_latest_entries(boards):
 
     llp.assert_called_once_with()
 
-    assert get.call_count == len(soups)
-    for call, url in zip(get.call_args_list, urls):
-        assert call.args == (url,)
-        assert call.kwargs == {"check": False}
-
-    rms.assert_called_once_with(entries)
+    kwargs = {"check": False, "parse_only": reader._listing_strainer}
+    assert sorted(calls) == sorted((url, kwargs) for url in urls)
 
 
 @given(st_metadatas())
-def test_read_metadata(meta):
+def test_read_metadata(reader, meta):
     """Test the debates metadata extractor works correctly."""
 
     block, date, idx, cat, url = meta
 
-    soup = mock.MagicMock()
-    soup.find.return_value.get_text.return_value = block
-
-    reader = mocked_debates()
+    soup = make_soup(f"<title>{html.escape(block)}</title>")
 
     metadata = reader._read_metadata(url, soup)
 
@@ -157,16 +150,32 @@ def test_read_metadata(meta):
     assert metadata["date"] == date.strftime("%Y-%m-%d")
     assert metadata["url"] == url
 
-    soup.find.assert_called_once_with("title")
-    soup.find.return_value.get_text.assert_called_once_with()
+
+@given(st_entry_urls())
+def test_is_settled(reader, url):
+    """Test that only entries from before today are settled."""
+
+    date = dt.date.fromisoformat(url.split("?id=")[-1][:10])
+
+    assert reader._is_settled(url) is (date < dt.date.today())
+
+
+@given(st.text(max_size=9))
+def test_read_metadata_invalid_index(reader, idx):
+    """Test the debates metadata extractor rejects undated entries."""
+
+    url = f"https://theyworkforyou.com/debates/?id={idx}"
+    soup = make_soup("<title>Title: 1 Jan 2024</title>")
+
+    with pytest.raises(ValueError, match="no date"):
+        reader._read_metadata(url, soup)
 
 
 @given(st_debate_soups())
-def test_read_contents(debate):
+def test_read_contents(reader, debate):
     """Test the logic of the content reader method."""
 
     soup, speakers, positions, hrefs, contents = debate
-    reader = mocked_debates()
 
     with mock.patch("parliai_public.Debates._process_speech") as process:
         process.side_effect = lambda x: x
@@ -192,7 +201,7 @@ def test_read_contents(debate):
 
 
 @given(st_speech_soups())
-def test_process_speech(speech):
+def test_process_speech(reader, speech):
     """
     Test the logic of the speech processor.
 
@@ -202,7 +211,6 @@ def test_process_speech(speech):
     """
 
     soup, name, position, href, text = speech
-    reader = mocked_debates()
 
     with (
         mock.patch(
@@ -224,11 +232,10 @@ def test_process_speech(speech):
 
 
 @given(st_speech_soups())
-def test_extract_speaker_details(speech):
+def test_extract_speaker_details(reader, speech):
     """Test the speaker details extractor."""
 
     soup, name, position, href, _ = speech
-    reader = mocked_debates()
 
     with mock.patch("parliai_public.Debates._get_detail_text") as get_detail:
         get_detail.side_effect = lambda x: x.get_text()
@@ -245,11 +252,10 @@ def test_extract_speaker_details(speech):
     ]
 
 
-def test_extract_speaker_details_none():
+def test_extract_speaker_details_none(reader):
     """Test the details extractor skips when there is no speaker."""
 
-    soup = BeautifulSoup()
-    reader = mocked_debates()
+    soup = BeautifulSoup("", "lxml")
 
     with mock.patch("parliai_public.Debates._get_detail_text") as get_detail:
         name, position, url = reader._extract_speaker_details(soup)
@@ -280,109 +286,113 @@ def test_get_detail_text_none():
 
 
 @given(st_speech_soups())
-def test_extract_speech_text(speech):
+def test_extract_speech_text(reader, speech):
     """Check the speech text extractor."""
 
     soup, *_, text = speech
-    reader = mocked_debates()
 
     extracted = reader._extract_speech_text(soup)
 
     assert extracted == text.strip()
 
 
-@given(
-    st.lists(st.booleans(), min_size=20, max_size=20), st_debate_transcripts()
-)
-def test_analyse(contains, transcript):
+@given(st_debate_analyses())
+def test_analyse(reader, analysis):
     """
     Test the speech analyst.
 
     We check the logic of the `Debates.analyse()` method here rather
     than its ability to analyse a debate transcript. Doing so would
     require accessing the LLM which is costly and time-consuming. So, we
-    mock out the super method.
+    mock out the batch analyst.
     """
 
-    reader = mocked_debates()
+    contains, transcript = analysis
+    speeches = transcript["speeches"]
+    relevant = any(contains)
 
     with (
         mock.patch("parliai_public.Debates.check_contains_terms") as checker,
-        mock.patch(
-            "parliai_public.readers.base.BaseReader.analyse"
-        ) as base_analyst,
+        mock.patch("parliai_public.Debates.analyse_many") as analyst,
     ):
-        checker.side_effect = contains
-        base_analyst.side_effect = lambda x: x
+        checker.side_effect = [relevant, *contains]
+        analyst.side_effect = lambda x: x
         page = reader.analyse(transcript)
 
     assert page == transcript
 
-    speeches = transcript["speeches"]
     checker_calls = checker.call_args_list
-    analyst_calls = base_analyst.call_args_list
-    for contain, speech in zip(contains, speeches):
-        checker_calls.pop(0).args == (speech["text"],)
-        if contain:
-            call = analyst_calls.pop(0)
-            assert call.args == (speech,)
 
-    assert checker_calls == []
-    assert analyst_calls == []
+    text = "\n".join(speech["text"] for speech in speeches)
+    assert checker_calls.pop(0).args == (text,)
 
+    if not relevant:
+        assert checker_calls == []
+        analyst.assert_not_called()
+        return
 
-@given(st_entry_urls())
-def test_parliament_label_valid(url):
-    """Check the labeller works as it should for valid URLs."""
+    for speech in speeches:
+        assert checker_calls.pop(0).args == (speech["text"],)
 
-    reader = mocked_debates()
+    assert checker_calls == []
+    analyst.assert_called_once_with(
+        [speech for speech, contain in zip(speeches, contains) if contain]
+    )
 
-    tag = reader.parliament_label(url)
 
-    LABEL_LOOKUP = {
-        "debates": "House of Commons",
-        "lords": "House of Lords",
-        "whall": "Westminster Hall",
-        "wms": "UK Ministerial statement",
-        "senedd": "Senedd / Welsh Parliament",
-        "sp": "Scottish Parliament",
-        "ni": "Northern Ireland Assembly",
-    }
+@pytest.mark.parametrize("category", CATEGORIES)
+def test_parliament_label_valid(reader, category):
+    """Check the labeller works as it should for valid URLs."""
+
+    tag = reader.parliament_label(build_entry_url(category, TODAY, "1"))
 
     assert isinstance(tag, str)
-    assert tag == LABEL_LOOKUP.get(url.split("/")[3])
+    assert tag == _LABEL_LOOKUP[category]
 
 
-@given(st_entry_urls(categories=[None]))
-def test_parliament_label_invalid(url):
+def test_parliament_label_invalid(reader):
     """Check the labeller catches an error for invalid URLs."""
 
-    reader = mocked_debates()
+    url = build_entry_url(None, TODAY, "1")
 
     assert reader.parliament_label(url) == "Unclassified"
 
 
+@pytest.mark.parametrize("cat", ("debates", "lords", "wrans"))
+@pytest.mark.parametrize("category", CATEGORIES)
+def test_parliament_label_from_category(reader, category, cat):
+    """Check the labeller prefers a known category over the URL."""
+
+    url = build_entry_url(category, TODAY, "1")
+    tag = reader.parliament_label(url, cat)
+
+    assert tag == {
+        "debates": "House of Commons",
+        "lords": "House of Lords",
+    }.get(cat, "Unclassified")
+
+
 @given(st_debate_transcripts())
-def test_render(transcript):
+def test_render(reader, transcript):
     """Test that a transcript rendering looks right."""
 
-    reader = mocked_debates()
-
     rendering = reader.render(transcript)
 
     assert isinstance(rendering, str)
-    assert len(rendering.split("\n\n")) == 1 + 2 * len(transcript["speeches"])
 
-    title = rendering.split("\n\n")[0]
+    parts = rendering.split("\n\n")
+    assert len(parts) == 1 + 2 * len(transcript["speeches"])
+
+    title = parts[0]
     assert transcript["title"] in title
     assert transcript["url"] in title
 
-    speakers = rendering.split("\n\n")[1::2]
+    speakers = parts[1::2]
     for speaker, speech in zip(speakers, transcript["speeches"]):
         assert speech["name"] in speaker
         assert speech["url"] in speaker
         assert speech["position"] in speaker
 
-    texts = rendering.split("\n\n")[2::2]
+    texts = parts[2::2]
     for text, speech in zip(texts, transcript["speeches"]):
         assert text == speech["response"]
@@ -1,17 +1,38 @@
 """Example regression tests for the written answers reader."""
 
-import requests
+import pytest
 from bs4 import BeautifulSoup
 
 from parliai_public import WrittenAnswers
 
+pytestmark = pytest.mark.usefixtures("recorded_pages")
+
+# One pooled session for the module, so the connection is reused
+SESSION = WrittenAnswers._make_session()
+
+
+@pytest.fixture(scope="module")
+def tool(tmp_path_factory):
+    """
+    Create one written answers reader that uses the shared session.
+
+    Its caches live in a temporary directory, so every run reads the
+    pages afresh and nothing is left behind in the repository.
+    """
+
+    outdir = tmp_path_factory.mktemp("out")
+    tool = WrittenAnswers(urls=[], outdir=str(outdir))
+    tool._session = SESSION
+
+    return tool
+
 
 def test_read_metadata_from_lead_2024_02_29_16305():
     """Test the lead extractor on entry 2024-02-29.16305."""
 
     url = "https://theyworkforyou.com/wrans/?id=2024-02-29.16305.h"
-    page = requests.get(url)
-    soup = BeautifulSoup(page.content, "html.parser")
+    page = SESSION.get(url, timeout=10)
+    soup = BeautifulSoup(page.content, "lxml")
 
     recipient, on = WrittenAnswers._read_metadata_from_lead(soup)
 
@@ -19,7 +40,7 @@ def test_read_metadata_from_lead_2024_02_29_16305():
     assert on == "2024-03-06"
 
 
-def test_answer_does_not_mention_terms_2024_02_19_HL2510():
+def test_answer_does_not_mention_terms_2024_02_19_HL2510(tool):
     """
     Test the output of entry 2024-02-19.HL2510 is parsed right.
 
@@ -29,7 +50,6 @@ def test_answer_does_not_mention_terms_2024_02_19_HL2510():
     """
 
     url = "https://www.theyworkforyou.com/wrans/?id=2024-02-19.HL2510.h"
-    tool = WrittenAnswers.from_toml()
 
     transcript = tool.read(url)
     assert isinstance(transcript, dict)
@@ -51,11 +71,10 @@ def test_answer_does_not_mention_terms_2024_02_19_HL2510():
     assert output.endswith("Answer does not mention any search terms.")
 
 
-def test_multiple_questions_rendering_2024_03_20_19670():
+def test_multiple_questions_rendering_2024_03_20_19670(tool):
     """Test for multiple questions like in entry 2024-03-20.19670."""
 
     url = "https://www.theyworkforyou.com/wrans/?id=2024-03-20.19670.h"
-    tool = WrittenAnswers.from_toml()
 
     transcript = tool.read(url)
     assert isinstance(transcript, dict)
@@ -72,7 +91,7 @@ def test_multiple_questions_rendering_2024_03_20_19670():
         assert question["url"] in output
 
 
-def test_pick_up_answer_block_2024_03_27_HL3698():
+def test_pick_up_answer_block_2024_03_27_HL3698(tool):
     """
     Test the output of entry 2024-03-27.HL3698.
 
@@ -80,7 +99,6 @@ def test_pick_up_answer_block_2024_03_27_HL3698():
     """
 
     url = "https://www.theyworkforyou.com/wrans/?id=2024-03-27.HL3698.h"
-    tool = WrittenAnswers.from_toml()
 
     transcript = tool.read(url)
     assert isinstance(transcript, dict)
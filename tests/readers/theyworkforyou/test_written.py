@@ -1,6 +1,6 @@
 """Unit tests for the written answers reader."""
 
-import warnings
+import html
 from unittest import mock
 
 import pytest
@@ -10,6 +10,7 @@ from hypothesis import strategies as st
 from parliai_public import WrittenAnswers
 
 from .strategies import (
+    make_soup,
     st_debate_soups,
     st_lead_metadatas,
     st_speeches,
@@ -48,23 +49,11 @@ def mocked_written(
     return written
 
 
-def mocked_caught_written(
-    urls=None,
-    terms=None,
-    dates=None,
-    outdir="out",
-    prompt=None,
-):
-    """Create a mocked written answers reader without warnings."""
+@pytest.fixture(scope="module")
+def reader():
+    """Share one default written answers reader between tests."""
 
-    with warnings.catch_warnings():
-        return mocked_written(
-            urls,
-            terms,
-            dates,
-            outdir,
-            prompt,
-        )
+    return mocked_written()
 
 
 @given(st.lists(provisional.urls(), min_size=1, max_size=5))
@@ -76,32 +65,26 @@ def test_init_warns(urls):
 
 
 @given(st_lead_metadatas())
-def test_read_metadata_from_lead(meta):
+def test_read_metadata_from_lead(reader, meta):
     """Test the lead metadata extractor works correctly."""
 
     lead, name, date = meta
-    written = mocked_caught_written()
 
-    soup = mock.MagicMock()
-    soup.find.return_value.get_text.return_value = lead
+    soup = make_soup(f'<p class="lead">{html.escape(lead)}</p>')
 
-    recipient, on = written._read_metadata_from_lead(soup)
+    recipient, on = reader._read_metadata_from_lead(soup)
 
     assert recipient == name
     assert on == date.isoformat()
 
-    soup.find.assert_called_once_with("p", attrs={"class": "lead"})
-    soup.find.return_value.get_text.assert_called_once_with()
-
 
 @given(st_speeches(), st_lead_metadatas())
-def test_read_metadata(speech, lead):
+def test_read_metadata(reader, speech, lead):
     """Test the full metadata extractor works correctly."""
 
     speech, speaker, position, url = speech
     _, recipient, on = lead
 
-    written = mocked_caught_written()
     with (
         mock.patch("parliai_public.Debates._read_metadata") as super_extract,
         mock.patch(
@@ -110,7 +93,7 @@ def test_read_metadata(speech, lead):
     ):
         super_extract.return_value = {"metadata": None}
         get_lead.return_value = (recipient, on)
-        metadata = written._read_metadata(url, "soup")
+        metadata = reader._read_metadata(url, "soup")
 
     assert isinstance(metadata, dict)
     assert metadata == {
@@ -124,28 +107,25 @@ def test_read_metadata(speech, lead):
 
 
 @given(st_debate_soups())
-def test_read_contents(debate):
+def test_read_contents(reader, debate):
     """Test the content reader method."""
 
     soup, speakers, positions, hrefs, contents = debate
-    reader = mocked_written()
-
-    super_content = {
-        "speeches": [
-            {
-                "name": speaker,
-                "position": position,
-                "url": href,
-                "text": content,
-            }
-            for speaker, position, href, content in zip(
-                speakers, positions, hrefs, contents
-            )
-        ]
-    }
 
-    with mock.patch("parliai_public.Debates._read_contents") as super_reader:
-        super_reader.return_value = super_content
+    speeches = [
+        {
+            "name": speaker,
+            "position": position,
+            "url": href,
+            "text": content,
+        }
+        for speaker, position, href, content in zip(
+            speakers, positions, hrefs, contents
+        )
+    ]
+
+    with mock.patch("parliai_public.Debates._iter_speeches") as iterator:
+        iterator.return_value = iter(speeches)
         content = reader._read_contents(soup)
 
     assert isinstance(content, dict)
@@ -154,13 +134,15 @@ def test_read_contents(debate):
 
     assert content == {}
     assert isinstance(questions, list)
-    assert questions == super_content["speeches"][:-1]
+    assert questions == speeches[:-1]
     assert isinstance(answer, dict)
-    assert answer == super_content["speeches"][-1]
+    assert answer == speeches[-1]
+
+    iterator.assert_called_once_with(soup)
 
 
 @given(st.booleans(), st_written_transcripts())
-def test_analyse(contains, transcript):
+def test_analyse(reader, contains, transcript):
     """
     Test the answer analyst method.
 
@@ -170,8 +152,6 @@ def test_analyse(contains, transcript):
     test the `BaseReader.analyse()` method this method calls.
     """
 
-    reader = mocked_written()
-
     with (
         mock.patch(
             "parliai_public.WrittenAnswers.check_contains_terms"
@@ -194,11 +174,9 @@ def test_analyse(contains, transcript):
 
 
 @given(st_written_transcripts())
-def test_render(transcript):
+def test_render(reader, transcript):
     """Test the written answer rendering looks right."""
 
-    reader = mocked_written()
-
     with mock.patch(
         "parliai_public.WrittenAnswers._render_answer"
     ) as render_answer:
@@ -206,9 +184,10 @@ def test_render(transcript):
         rendering = reader.render(transcript)
 
     assert isinstance(rendering, str)
-    assert len(rendering.split("\n\n")) == 3 + 2 * len(transcript["questions"])
 
     parts = rendering.split("\n\n")
+    assert len(parts) == 3 + 2 * len(transcript["questions"])
+
     title = parts[0]
     assert transcript["title"] in title
     assert transcript["url"] in title
@@ -252,9 +231,10 @@ def test_render_answer_response(speech):
 
     assert isinstance(rendering, str)
     assert rendering.startswith("### Answered by ")
-    assert len(rendering.split("\n\n")) == 2
+    parts = rendering.split("\n\n")
+    assert len(parts) == 2
 
-    title, answer = rendering.split("\n\n")
+    title, answer = parts
     assert name in title
     assert url in title
     assert position in title
@@ -277,9 +257,10 @@ def test_render_answer_without_response(speech):
 
     assert isinstance(rendering, str)
     assert rendering.startswith("### Answered by ")
-    assert len(rendering.split("\n\n")) == 2
+    parts = rendering.split("\n\n")
+    assert len(parts) == 2
 
-    title, answer = rendering.split("\n\n")
+    title, answer = parts
     assert name in title
     assert url in title
     assert position in title